@@ -7,6 +7,7 @@ as documented in docs/architecture/core-agent-architecture.md
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
 
@@ -60,6 +61,11 @@ class Evidence:
     timestamp: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    @cached_property
+    def lowered_content(self) -> str:
+        """Lowercase content, computed once and shared by text-matching steps."""
+        return self.content.lower()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -1299,6 +1299,25 @@ async def startup_event():
         print(f"Failed to initialize Prometheus metrics: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop evidence cache maintenance and close shared HTTP sessions on shutdown"""
+    try:
+        from src.services.evidence_service import evidence_service, close_shared_session
+
+        await evidence_service.aclose()
+        await close_shared_session()
+    except Exception as e:
+        print(f"Failed to close evidence HTTP session: {e}")
+
+    try:
+        from src.services.llm_service import close_shared_session as close_llm_session
+
+        await close_llm_session()
+    except Exception as e:
+        print(f"Failed to close LLM HTTP session: {e}")
+
+
 # Middleware to track API metrics
 @app.middleware("http")
 async def track_metrics(request, call_next):
@@ -6,12 +6,15 @@ based on the 3-tier LLM strategy defined in config/llm_config.py
 """
 
 import os
+import re
 import asyncio
 import aiohttp
 import time
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Mapping
 from dataclasses import asdict
 
 # Setup logger
@@ -25,9 +28,155 @@ from src.config.llm_config import (
 from src.agents.agent_models import LLMRequest, LLMResponse
 
 
+# Process-wide HTTP session shared by all LLMService instances
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_prewarm_task: Optional[asyncio.Task] = None
+
+# Environment variables holding each provider's API key
+_PROVIDER_API_KEYS = {
+    LLMProvider.OPENAI: "OPENAI_API_KEY",
+    LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
+}
+
+
+async def _prewarm_connections(session: aiohttp.ClientSession, timeout: float = 5.0):
+    """
+    Open pooled connections to every provider with a configured API key.
+    
+    Sends a HEAD request to each provider's base URL; the response status
+    is irrelevant, only the kept-alive connection matters. Failures are
+    ignored and the connection is simply made on first use.
+    
+    Args:
+        session: Session whose connection pool to warm
+        timeout: Per-request timeout in seconds
+    """
+    async def warm(base_url: str):
+        async with session.head(base_url, timeout=aiohttp.ClientTimeout(total=timeout)):
+            pass
+    
+    base_urls = tuple({
+        get_provider_settings(provider)["base_url"]
+        for provider, env_var in _PROVIDER_API_KEYS.items()
+        if os.getenv(env_var)
+    })
+    results = await asyncio.gather(*(warm(url) for url in base_urls), return_exceptions=True)
+    for base_url, result in zip(base_urls, results):
+        if isinstance(result, Exception):
+            logger.debug(f"Connection pre-warm failed for {base_url}: {result}")
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide HTTP session for LLM provider APIs, creating it on first use.
+    
+    Keeping one pooled session lets consecutive calls to OpenAI and Anthropic
+    reuse warm TCP/TLS connections instead of handshaking per request. The
+    providers are contacted in the background as soon as the session is
+    created. It is recreated if it was closed or belongs to a different
+    event loop.
+    
+    Returns:
+        Shared aiohttp ClientSession bound to the running event loop
+    """
+    global _shared_session, _shared_session_loop, _prewarm_task
+    
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        _shared_session = aiohttp.ClientSession(connector=connector)
+        _shared_session_loop = loop
+        _prewarm_task = loop.create_task(_prewarm_connections(_shared_session))
+    
+    return _shared_session
+
+
+async def close_shared_session():
+    """Close the process-wide LLM HTTP session (call on application shutdown)."""
+    global _shared_session, _shared_session_loop, _prewarm_task
+    
+    if _prewarm_task is not None and not _prewarm_task.done():
+        _prewarm_task.cancel()
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+    _prewarm_task = None
+
+
+# Response headers carrying request quota state, per provider: (limit, remaining, reset)
+_RATE_LIMIT_HEADERS = {
+    LLMProvider.OPENAI: (
+        "x-ratelimit-limit-requests",
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-reset-requests",
+    ),
+    LLMProvider.ANTHROPIC: (
+        "anthropic-ratelimit-requests-limit",
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-requests-reset",
+    ),
+}
+
+# Units of OpenAI reset durations such as "1s", "6m0s" or "120ms"
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset_seconds(value: str) -> Optional[float]:
+    """
+    Parse a rate-limit reset header into seconds from now.
+    
+    Accepts OpenAI durations ("6m0s"), Anthropic RFC 3339 timestamps and
+    plain numbers of seconds (as used by retry-after).
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    parts = _DURATION_PART_RE.findall(value)
+    if parts:
+        return sum(float(amount) * _DURATION_UNIT_SECONDS[unit] for amount, unit in parts)
+    
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class LLMServiceError(Exception):
     """Base exception for LLM service errors."""
-    pass
+    
+    def __init__(self, message: str = "", status: Optional[int] = None, timeout: bool = False):
+        """
+        Initialize the error.
+        
+        Args:
+            message: Error description
+            status: HTTP status returned by the provider, if a response was received
+            timeout: Whether the request timed out
+        """
+        super().__init__(message)
+        self.status = status
+        self.timeout = timeout
+    
+    @property
+    def indicates_overload(self) -> bool:
+        """Whether the provider signalled overload (429, 5xx or timeout)."""
+        return self.timeout or self.status == 429 or (self.status is not None and self.status >= 500)
 
 
 class LLMAPIError(LLMServiceError):
@@ -40,6 +189,96 @@ class LLMRateLimitError(LLMServiceError):
     pass
 
 
+class AIMDController:
+    """
+    Adaptive concurrency limit for provider calls (additive increase,
+    multiplicative decrease).
+    
+    Each success within the latency target raises the limit by alpha; a
+    congestion event (rate limit, server error, timeout) multiplies it by
+    beta, so the number of in-flight requests settles near what providers
+    can sustain. Errors from calls admitted before the last decrease belong
+    to the same congestion event and do not cut the limit again.
+    """
+    
+    def __init__(self, initial_limit: float = 8.0, min_limit: float = 1.0,
+                 max_limit: float = 64.0, alpha: float = 0.5, beta: float = 0.5,
+                 target_latency_ms: float = 10000.0):
+        """
+        Initialize the controller.
+        
+        Args:
+            initial_limit: Starting number of concurrent calls
+            min_limit: Lowest limit errors can push it down to
+            max_limit: Highest limit successes can raise it to
+            alpha: Additive increase per fast success
+            beta: Multiplicative decrease factor per error
+            target_latency_ms: Successes slower than this do not raise the limit
+        """
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency_ms = target_latency_ms
+        self.in_flight = 0
+        # Admission sequence number of the latest call, and of the latest
+        # call admitted before the last decrease
+        self._admitted = 0
+        self._recovery_point = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_condition(self) -> asyncio.Condition:
+        """Get the admission condition bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+            self.in_flight = 0
+        return self._condition
+    
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one concurrency slot, waiting while the limit is reached.
+        
+        Yields:
+            Admission ticket to pass to on_error if the call fails
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            self._admitted += 1
+            ticket = self._admitted
+        try:
+            yield ticket
+        finally:
+            async with condition:
+                self.in_flight -= 1
+                condition.notify_all()
+    
+    def on_success(self, latency_ms: float):
+        """Raise the limit additively after a call within the latency target."""
+        if latency_ms <= self.target_latency_ms:
+            self.limit = min(self.max_limit, self.limit + self.alpha)
+    
+    def on_error(self, ticket: Optional[int] = None):
+        """
+        Cut the limit multiplicatively after a failed call.
+        
+        Args:
+            ticket: Admission ticket of the failed call from slot(); failures
+                of calls admitted before the last decrease are ignored. None
+                always counts as a new congestion event.
+        """
+        if ticket is not None and ticket <= self._recovery_point:
+            return
+        self.limit = max(self.min_limit, self.limit * self.beta)
+        self._recovery_point = self._admitted
+
+
 class LLMService:
     """
     Production LLM service with real API connections.
@@ -52,6 +291,7 @@ class LLMService:
     def __init__(self):
         """Initialize the LLM service with API configurations."""
         self.session = None
+        self._session_loop = None
         self.usage_tracking = {
             "requests_today": 0,
             "cost_today": 0.0,
@@ -64,15 +304,117 @@ class LLMService:
         # Check API key availability
         self.available_providers = self._check_api_availability()
         
+        # Request quota per provider, as last reported in response headers:
+        # {"limit": float, "remaining": float, "reset_at": monotonic seconds,
+        #  "reserved": requests admitted since the last report}
+        self._rate_limit_state: Dict[LLMProvider, Dict[str, float]] = {}
+        
+        # Adaptive bound on concurrent provider calls
+        self.concurrency = AIMDController()
+        
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = get_shared_session()
+        self._session_loop = asyncio.get_running_loop()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        # The shared session outlives this context (and may be in use by
+        # concurrent callers); it is closed on shutdown via close_shared_session()
+        pass
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session for provider calls.
+        
+        Uses the session from the last async with while it is open and bound
+        to the running event loop; otherwise (never entered, closed, or
+        entered under an earlier loop) falls back to the shared session.
+        """
+        if (
+            self.session is None
+            or self.session.closed
+            or self._session_loop is not asyncio.get_running_loop()
+        ):
+            return get_shared_session()
+        return self.session
+    
+    def _update_rate_limit(self, provider: LLMProvider, headers: Mapping[str, str]):
+        """
+        Record the provider's remaining request quota from response headers.
+        
+        Args:
+            provider: Provider that sent the response
+            headers: Response headers
+        """
+        limit_header, remaining_header, reset_header = _RATE_LIMIT_HEADERS[provider]
+        state = self._rate_limit_state.setdefault(provider, {})
+        now = time.monotonic()
+        
+        try:
+            if limit_header in headers:
+                state["limit"] = float(headers[limit_header])
+            if remaining_header in headers:
+                state["remaining"] = float(headers[remaining_header])
+                state["reserved"] = 0.0
+        except ValueError:
+            pass
+        
+        reset_seconds = _parse_reset_seconds(headers[reset_header]) if reset_header in headers else None
+        if reset_seconds is not None:
+            state["reset_at"] = now + reset_seconds
+        
+        # retry-after (sent with 429s) means no capacity until it elapses
+        retry_after = _parse_reset_seconds(headers["retry-after"]) if "retry-after" in headers else None
+        if retry_after is not None:
+            state["remaining"] = 0.0
+            state["reset_at"] = max(state.get("reset_at", now), now + retry_after)
+    
+    async def _wait_if_throttled(self, provider: LLMProvider, max_wait: float = 2.0):
+        """
+        Wait for request quota before calling a provider.
+        
+        Fails fast only when the provider reported its quota as used up and
+        it will not reset within max_wait, so the caller can fall back to
+        another model instead of collecting a 429. When the quota is merely
+        low, waits for a reset that is due within max_wait and otherwise lets
+        the request through, since its response refreshes the quota state.
+        
+        Args:
+            provider: Provider about to be called
+            max_wait: Longest time to wait for the quota to reset, in seconds
+            
+        Raises:
+            LLMRateLimitError: If the quota is exhausted and will not reset within max_wait
+        """
+        state = self._rate_limit_state.get(provider)
+        if not state or "remaining" not in state:
+            return
+        
+        wait = state.get("reset_at", 0.0) - time.monotonic()
+        if wait <= 0:
+            # Quota window has passed; the next response reports the new one
+            self._rate_limit_state.pop(provider, None)
+            return
+        
+        if state["remaining"] <= 0:
+            if wait > max_wait:
+                raise LLMRateLimitError(
+                    f"{provider.value} request quota exhausted, resets in {wait:.1f}s"
+                )
+            await asyncio.sleep(wait)
+            self._rate_limit_state.pop(provider, None)
+            return
+        
+        threshold = max(2.0, 0.1 * state.get("limit", 0.0))
+        if state["remaining"] - state.get("reserved", 0.0) < threshold and wait <= max_wait:
+            await asyncio.sleep(wait)
+            self._rate_limit_state.pop(provider, None)
+            return
+        
+        # Reserve one request so concurrent callers see the reduced quota
+        state["reserved"] = state.get("reserved", 0.0) + 1
     
     def _check_api_availability(self) -> Dict[LLMProvider, bool]:
         """Check which API providers are available based on environment variables."""
@@ -153,18 +495,22 @@ Format your response as JSON with the following structure:
             "temperature": config.temperature
         }
         
+        await self._wait_if_throttled(LLMProvider.OPENAI)
+        
         try:
-            async with self.session.post(
+            async with self._get_session().post(
                 f"{settings['base_url']}/chat/completions",
                 headers=headers,
                 json=payload,
                 timeout=settings['timeout']
             ) as response:
                 
+                self._update_rate_limit(LLMProvider.OPENAI, response.headers)
+                
                 if response.status == 429:
-                    raise LLMRateLimitError("OpenAI rate limit exceeded")
+                    raise LLMRateLimitError("OpenAI rate limit exceeded", status=429)
                 elif response.status != 200:
-                    raise LLMAPIError(f"OpenAI API error: {response.status}")
+                    raise LLMAPIError(f"OpenAI API error: {response.status}", status=response.status)
                 
                 data = await response.json()
                 
@@ -181,7 +527,9 @@ Format your response as JSON with the following structure:
                 )
                 
         except asyncio.TimeoutError:
-            raise LLMAPIError("OpenAI API timeout")
+            raise LLMAPIError("OpenAI API timeout", timeout=True)
+        except LLMServiceError:
+            raise
         except Exception as e:
             raise LLMAPIError(f"OpenAI API error: {str(e)}")
     
@@ -205,18 +553,22 @@ Format your response as JSON with the following structure:
             ]
         }
         
+        await self._wait_if_throttled(LLMProvider.ANTHROPIC)
+        
         try:
-            async with self.session.post(
+            async with self._get_session().post(
                 f"{settings['base_url']}/messages",
                 headers=headers,
                 json=payload,
                 timeout=settings['timeout']
             ) as response:
                 
+                self._update_rate_limit(LLMProvider.ANTHROPIC, response.headers)
+                
                 if response.status == 429:
-                    raise LLMRateLimitError("Anthropic rate limit exceeded")
+                    raise LLMRateLimitError("Anthropic rate limit exceeded", status=429)
                 elif response.status != 200:
-                    raise LLMAPIError(f"Anthropic API error: {response.status}")
+                    raise LLMAPIError(f"Anthropic API error: {response.status}", status=response.status)
                 
                 data = await response.json()
                 
@@ -233,7 +585,9 @@ Format your response as JSON with the following structure:
                 )
                 
         except asyncio.TimeoutError:
-            raise LLMAPIError("Anthropic API timeout")
+            raise LLMAPIError("Anthropic API timeout", timeout=True)
+        except LLMServiceError:
+            raise
         except Exception as e:
             raise LLMAPIError(f"Anthropic API error: {str(e)}")
     
@@ -254,7 +608,7 @@ Format your response as JSON with the following structure:
         }
         
         try:
-            async with self.session.post(
+            async with self._get_session().post(
                 f"{settings['base_url']}/api/generate",
                 json=payload,
                 timeout=settings['timeout']
@@ -379,10 +733,6 @@ Format your response as JSON with the following structure:
         # Select optimal model based on adjusted parameters
         primary_model = select_optimal_model(complexity, privacy, urgency)
         
-        # Try primary model
-        if not self.session:
-            raise LLMServiceError("LLM service not initialized. Use async context manager.")
-        
         errors = []
         models_tried = []
         
@@ -416,6 +766,7 @@ Format your response as JSON with the following structure:
                 errors.append(f"{config.provider.value} not available (missing API key)")
                 continue
             
+            ticket = None
             try:
                 start_time = time.time()
                 models_tried.append(model.value)
@@ -432,13 +783,16 @@ Format your response as JSON with the following structure:
                     }
                 )
                 
-                # Call appropriate provider
-                if config.provider == LLMProvider.OPENAI:
-                    response = await self.call_openai(enhanced_request)
-                elif config.provider == LLMProvider.ANTHROPIC:
-                    response = await self.call_anthropic(enhanced_request)
-                else:
-                    raise LLMServiceError(f"Unsupported provider: {config.provider}")
+                # Call appropriate provider within the adaptive concurrency limit
+                async with self.concurrency.slot() as ticket:
+                    call_start = time.time()
+                    if config.provider == LLMProvider.OPENAI:
+                        response = await self.call_openai(enhanced_request)
+                    elif config.provider == LLMProvider.ANTHROPIC:
+                        response = await self.call_anthropic(enhanced_request)
+                    else:
+                        raise LLMServiceError(f"Unsupported provider: {config.provider}")
+                    self.concurrency.on_success((time.time() - call_start) * 1000)
                 
                 # Extract structured data from response
                 structured_data = self.extract_structured_response(response.content)
@@ -474,6 +828,10 @@ Format your response as JSON with the following structure:
                 return response
                 
             except (LLMAPIError, LLMRateLimitError) as e:
+                # Only provider overload shrinks concurrency; client errors
+                # (bad key, malformed response) and local throttling do not
+                if e.indicates_overload:
+                    self.concurrency.on_error(ticket)
                 errors.append(f"{model.value}: {str(e)}")
                 continue
         
@@ -521,6 +879,7 @@ but still maintain appropriate skepticism.""".format(evidence_quality)
         """Get current usage statistics."""
         return {
             "usage_tracking": self.usage_tracking,
+            "concurrency_limit": int(self.concurrency.limit),
             "available_providers": {
                 provider.value: available 
                 for provider, available in self.available_providers.items()
@@ -0,0 +1,574 @@
+"""
+Tests for evidence service request handling.
+
+Covers background cache maintenance, connection pre-warming, the optional
+disk cache, coalescing of concurrent identical searches, the hedged
+Wikipedia lookup, per-source rate limiting, near-duplicate removal and
+batch relevance scoring.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import aiohttp
+import orjson
+import pytest
+from yarl import URL
+
+from src.agents.agent_models import Evidence
+from src.services import evidence_service as evidence_service_module
+from src.services.evidence_service import (
+    EvidenceService, _TokenBucket, _singleflight, close_shared_session
+)
+
+
+PARIS = (
+    "Paris is the capital and most populous city of France. With an estimated "
+    "population of 2,102,650 residents in January 2023 in an area of more than "
+    "105 km2, Paris is the fourth-largest city in the European Union."
+)
+PARIS_REVISED = PARIS.replace("residents in January", "residents as of January")
+BERLIN = (
+    "Berlin is the capital and largest city of Germany, by both area and "
+    "population. With 3.85 million inhabitants, it has the highest population "
+    "within its city limits of any city in the European Union."
+)
+
+
+def make_evidence(content: str, source: str = "wikipedia.org",
+                  credibility: float = 0.5, relevance: float = 0.5) -> Evidence:
+    """Build an Evidence item with the given content and scores."""
+    return Evidence(
+        content=content,
+        source=source,
+        credibility_score=credibility,
+        relevance_score=relevance,
+        timestamp=datetime.now()
+    )
+
+
+class TestCacheExpiryTask:
+    """Test the lifecycle of the periodic cache expiry task."""
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_expiry_task(self, monkeypatch):
+        """Test that aclose stops the task started by the context manager."""
+        async def no_prewarm(session):
+            pass
+
+        monkeypatch.setattr(evidence_service_module, "_prewarm_connections", no_prewarm)
+        service = EvidenceService()
+        try:
+            async with service:
+                task = service._cache_expiry_task
+                assert not task.done()
+
+            await service.aclose()
+        finally:
+            await close_shared_session()
+
+        assert task.cancelled()
+        assert service._cache_expiry_task is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_task(self):
+        """Test that aclose is safe before entering and when called twice."""
+        service = EvidenceService()
+
+        await service.aclose()
+        await service.aclose()
+
+
+class HeadRecordingSession:
+    """Session stand-in recording the URLs sent HEAD requests."""
+
+    def __init__(self):
+        self.heads = []
+
+    @asynccontextmanager
+    async def head(self, url, **kwargs):
+        self.heads.append(url)
+        yield None
+
+
+class TestPrewarm:
+    """Test background pre-warming of evidence API connections."""
+
+    @pytest.mark.asyncio
+    async def test_sources_without_keys_are_skipped(self, monkeypatch):
+        """Test that keyed APIs are contacted only when their keys are set."""
+        monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+        monkeypatch.setenv("GOOGLE_API_KEY", "test")
+        monkeypatch.delenv("GOOGLE_CSE_ID", raising=False)
+        session = HeadRecordingSession()
+
+        await evidence_service_module._prewarm_connections(session)
+
+        assert sorted(session.heads) == [
+            "http://export.arxiv.org/",
+            "https://en.wikipedia.org/",
+            "https://eutils.ncbi.nlm.nih.gov/",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_configured_sources_are_warmed(self, monkeypatch):
+        """Test that NewsAPI and Google are contacted once fully configured."""
+        monkeypatch.setenv("NEWSAPI_KEY", "test")
+        monkeypatch.setenv("GOOGLE_API_KEY", "test")
+        monkeypatch.setenv("GOOGLE_CSE_ID", "test")
+        session = HeadRecordingSession()
+
+        await evidence_service_module._prewarm_connections(session)
+
+        assert "https://newsapi.org/" in session.heads
+        assert "https://www.googleapis.com/" in session.heads
+
+
+class TestDiskCache:
+    """Test the optional persistent second-level evidence cache."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that caching stays in memory when EVIDENCE_CACHE_DIR is unset."""
+        monkeypatch.delenv("EVIDENCE_CACHE_DIR", raising=False)
+
+        assert EvidenceService().disk_cache is None
+
+    @pytest.mark.asyncio
+    async def test_entries_shared_across_instances(self, monkeypatch, tmp_path):
+        """Test that evidence written by one service is read back by another."""
+        monkeypatch.setenv("EVIDENCE_CACHE_DIR", str(tmp_path))
+        writer = EvidenceService()
+        reader = EvidenceService()
+        key = writer._generate_cache_key("paris", "wikipedia")
+        try:
+            await writer._set_cached("wikipedia", key, [make_evidence(PARIS)])
+
+            assert reader.cache["wikipedia"].get(key) is None
+            cached = await reader._get_cached("wikipedia", key)
+
+            assert [e.content for e in cached] == [PARIS]
+            assert reader.cache["wikipedia"][key] is cached
+        finally:
+            writer.disk_cache.close()
+            reader.disk_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_unusable_directory_falls_back_to_memory(self, monkeypatch, tmp_path):
+        """Test that a cache directory that cannot be created does not break the service."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("EVIDENCE_CACHE_DIR", str(blocker / "cache"))
+
+        service = EvidenceService()
+        key = service._generate_cache_key("paris", "wikipedia")
+        await service._set_cached("wikipedia", key, [make_evidence(PARIS)])
+
+        assert service.disk_cache is None
+        assert await service._get_cached("wikipedia", key) is not None
+
+
+class CoalescedSearch:
+    """Minimal search owner exercising the single-flight decorator."""
+
+    _generate_cache_key = EvidenceService._generate_cache_key
+
+    def __init__(self):
+        self._inflight = {}
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = None
+
+    @_singleflight("wikipedia")
+    async def search(self, query: str, limit: int = 3):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return [f"{query}:{self.calls}"]
+
+
+class TestSingleflight:
+    """Test coalescing of concurrent identical searches."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self):
+        """Test that followers receive the leader's result."""
+        owner = CoalescedSearch()
+        tasks = [asyncio.create_task(owner.search("paris")) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        owner.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert owner.calls == 1
+        assert results == [["paris:1"]] * 3
+        assert owner._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_queries_are_not_coalesced(self):
+        """Test that only identical queries share a request."""
+        owner = CoalescedSearch()
+        owner.release.set()
+
+        await asyncio.gather(owner.search("paris"), owner.search("berlin"))
+
+        assert owner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_fans_out_to_followers(self):
+        """Test that followers see the leader's exception."""
+        owner = CoalescedSearch()
+        owner.error = ValueError("upstream failed")
+        tasks = [asyncio.create_task(owner.search("paris")) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        owner.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert owner.calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert owner._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_reruns_for_followers(self):
+        """Test that cancelling the leader does not cancel other callers."""
+        owner = CoalescedSearch()
+        leader = asyncio.create_task(owner.search("paris"))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(owner.search("paris")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        for _ in range(3):
+            # Let the leader unwind and the followers pick a new leader
+            await asyncio.sleep(0)
+        owner.release.set()
+        results = await asyncio.gather(*followers, return_exceptions=True)
+
+        assert leader.cancelled()
+        assert results == [["paris:2"]] * 2
+        assert owner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_follower_cancellation_leaves_leader_running(self):
+        """Test that a cancelled follower neither retries nor cancels the leader."""
+        owner = CoalescedSearch()
+        leader = asyncio.create_task(owner.search("paris"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(owner.search("paris"))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        owner.release.set()
+
+        assert await leader == ["paris:1"]
+        assert owner.calls == 1
+
+
+class WikipediaResponse:
+    """Response stand-in with a status and a JSON body."""
+
+    def __init__(self, status: int, payload: dict):
+        self.status = status
+        self.payload = payload
+
+    async def read(self):
+        return orjson.dumps(self.payload)
+
+
+class WikipediaSession:
+    """Session stand-in serving page summaries and title searches."""
+
+    def __init__(self, pages=None, titles=(), failing=(), delays=None,
+                 search_error=None, block_search=False):
+        self.pages = pages or {}
+        self.titles = list(titles)
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.search_error = search_error
+        self.search_gate = asyncio.Event()
+        if not block_search:
+            self.search_gate.set()
+        self.search_cancelled = False
+        self.summaries_requested = []
+
+    @asynccontextmanager
+    async def get(self, url, params=None):
+        if params is not None:
+            try:
+                await self.search_gate.wait()
+            except asyncio.CancelledError:
+                self.search_cancelled = True
+                raise
+            if self.search_error is not None:
+                raise self.search_error
+            yield WikipediaResponse(200, {"query": {"search": [{"title": t} for t in self.titles]}})
+            return
+
+        title = URL(str(url)).name.replace("_", " ")
+        self.summaries_requested.append(title)
+        await asyncio.sleep(self.delays.get(title, 0))
+        if title in self.failing:
+            raise aiohttp.ClientConnectionError(f"{title} unreachable")
+        if title in self.pages:
+            yield WikipediaResponse(200, {"extract": self.pages[title]})
+        else:
+            yield WikipediaResponse(404, {})
+
+
+class TestSearchWikipedia:
+    """Test the hedged direct-page and title-search Wikipedia lookup."""
+
+    @pytest.mark.asyncio
+    async def test_direct_hit_cancels_title_search(self):
+        """Test that a direct page match is returned alone and the search is dropped."""
+        session = WikipediaSession(pages={"Paris": PARIS}, titles=["Berlin"], block_search=True)
+        service = EvidenceService(session=session)
+
+        evidence = await service.search_wikipedia("Paris")
+        await asyncio.sleep(0)
+
+        assert [e.content for e in evidence] == [PARIS]
+        assert session.search_cancelled
+        assert session.summaries_requested == ["Paris"]
+
+    @pytest.mark.asyncio
+    async def test_missing_direct_page_uses_search_ranking(self):
+        """Test that a 404 on the direct page falls back to results in rank order."""
+        session = WikipediaSession(
+            pages={"Paris": PARIS, "Berlin": BERLIN},
+            titles=["Paris", "Berlin"],
+            delays={"Paris": 0.02}
+        )
+        service = EvidenceService(session=session)
+
+        evidence = await service.search_wikipedia("capital cities")
+
+        assert [e.content for e in evidence] == [PARIS, BERLIN]
+
+    @pytest.mark.asyncio
+    async def test_failed_direct_lookup_uses_search_results(self):
+        """Test that an error on the direct page is swallowed in favour of the search."""
+        session = WikipediaSession(
+            pages={"Paris": PARIS},
+            titles=["Paris"],
+            failing=["capital of France"]
+        )
+        service = EvidenceService(session=session)
+
+        evidence = await service.search_wikipedia("capital of France")
+
+        assert [e.content for e in evidence] == [PARIS]
+
+    @pytest.mark.asyncio
+    async def test_failing_title_fetch_is_skipped(self):
+        """Test that one unreachable result page does not drop the others."""
+        session = WikipediaSession(
+            pages={"Paris": PARIS, "Berlin": BERLIN},
+            titles=["Paris", "Rome", "Berlin"],
+            failing=["Rome"]
+        )
+        service = EvidenceService(session=session)
+
+        evidence = await service.search_wikipedia("capital cities")
+
+        assert [e.content for e in evidence] == [PARIS, BERLIN]
+
+    @pytest.mark.asyncio
+    async def test_both_paths_failing_returns_placeholder(self):
+        """Test that placeholder evidence is returned when neither lookup works."""
+        session = WikipediaSession(
+            failing=["capital of France"],
+            search_error=aiohttp.ClientConnectionError("search unreachable")
+        )
+        service = EvidenceService(session=session)
+
+        evidence = await service.search_wikipedia("capital of France")
+
+        assert len(evidence) == 1
+        assert evidence[0].content.startswith("Unable to retrieve Wikipedia content")
+        assert "search unreachable" in evidence[0].content
+        assert evidence[0].credibility_score == 0.3
+
+
+class TestTokenBucket:
+    """Test the per-source token bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity(self):
+        """Test that a full bucket admits `requests` calls without waiting."""
+        bucket = _TokenBucket(3, 1)
+
+        start = time.monotonic()
+        results = [await bucket.acquire() for _ in range(3)]
+
+        assert results == [True, True, True]
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_over_time(self):
+        """Test that tokens come back at requests/window per second, up to capacity."""
+        bucket = _TokenBucket(2, 1)
+        await bucket.acquire()
+        await bucket.acquire()
+
+        bucket.last -= 0.5  # Half a window has passed
+        assert await bucket.acquire(max_sleep=0) is True
+        assert await bucket.acquire(max_sleep=0) is False
+
+        bucket.last -= 10  # Long idle periods never exceed capacity
+        await bucket.acquire()
+        assert bucket.tokens == pytest.approx(1.0, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_next_token(self):
+        """Test that an empty bucket sleeps until the next token instead of rejecting."""
+        bucket = _TokenBucket(1, 0.1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        assert await bucket.acquire() is True
+        assert 0.08 <= time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_queue(self):
+        """Test that concurrent waiters reserve successive tokens."""
+        bucket = _TokenBucket(1, 0.1)
+        await bucket.acquire()
+        start = time.monotonic()
+        finished = []
+
+        async def acquire():
+            assert await bucket.acquire() is True
+            finished.append(time.monotonic() - start)
+
+        await asyncio.gather(acquire(), acquire())
+
+        assert finished[0] >= 0.08
+        assert finished[1] >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_wait_longer_than_max_sleep_is_rejected(self):
+        """Test that rejection is immediate and does not consume a token."""
+        bucket = _TokenBucket(1, 10)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        assert await bucket.acquire(max_sleep=0.5) is False
+        assert await bucket.acquire(max_sleep=0.5) is False
+
+        assert time.monotonic() - start < 0.05
+        assert bucket.tokens >= 0
+
+    @pytest.mark.asyncio
+    async def test_daily_quota_exhaustion(self):
+        """Test that a used-up daily quota rejects until enough time passes."""
+        service = EvidenceService()
+
+        for _ in range(100):
+            assert await service._check_rate_limit("newsapi") is True
+        assert await service._check_rate_limit("newsapi") is False
+        assert await service._check_rate_limit("newsapi") is False
+
+        service.rate_buckets["newsapi"].last -= 864  # One token's worth of a day
+        assert await service._check_rate_limit("newsapi") is True
+
+    @pytest.mark.asyncio
+    async def test_unlimited_source(self):
+        """Test that sources without a configured limit are always admitted."""
+        service = EvidenceService()
+
+        assert await service._check_rate_limit("wikipedia") is True
+
+
+class TestDeduplicateEvidence:
+    """Test near-duplicate removal of gathered evidence."""
+
+    def test_empty_list(self):
+        """Test that an empty list is returned unchanged."""
+        assert EvidenceService()._deduplicate_evidence([]) == []
+
+    def test_near_duplicates_collapse(self):
+        """Test that lightly edited copies of the same text are merged."""
+        evidence = [make_evidence(PARIS), make_evidence(PARIS_REVISED), make_evidence(PARIS.upper())]
+
+        unique = EvidenceService()._deduplicate_evidence(evidence)
+
+        assert len(unique) == 1
+
+    def test_distinct_content_kept(self):
+        """Test that different texts on a similar topic are both kept."""
+        evidence = [make_evidence(PARIS), make_evidence(BERLIN)]
+
+        unique = EvidenceService()._deduplicate_evidence(evidence)
+
+        assert [e.content for e in unique] == [PARIS, BERLIN]
+
+    def test_keeps_higher_scoring_copy(self):
+        """Test that the duplicate with higher credibility * relevance wins, in place."""
+        weak = make_evidence(PARIS, source="blog.example", credibility=0.4, relevance=0.5)
+        other = make_evidence(BERLIN)
+        strong = make_evidence(PARIS_REVISED, source="britannica.com", credibility=0.9, relevance=0.8)
+
+        unique = EvidenceService()._deduplicate_evidence([weak, other, strong])
+
+        assert unique == [strong, other]
+
+    def test_lower_scoring_duplicate_dropped(self):
+        """Test that a later, weaker duplicate does not replace the kept copy."""
+        strong = make_evidence(PARIS, credibility=0.9, relevance=0.9)
+        weak = make_evidence(PARIS_REVISED, credibility=0.1, relevance=0.1)
+
+        assert EvidenceService()._deduplicate_evidence([strong, weak]) == [strong]
+
+    def test_prefix_of_longer_text_kept(self):
+        """Test that a short excerpt of a longer text is below the threshold."""
+        evidence = [make_evidence(PARIS), make_evidence(PARIS[:60])]
+
+        assert len(EvidenceService()._deduplicate_evidence(evidence)) == 2
+
+
+class TestScoreRelevance:
+    """Test batch relevance scoring of search results."""
+
+    def test_empty_batch(self):
+        """Test that an empty batch is accepted."""
+        EvidenceService()._score_relevance("paris", [])
+
+    def test_scores_in_place_and_in_range(self):
+        """Test that every item gets a rounded score between 0.0 and 1.0."""
+        evidence = [make_evidence(PARIS, relevance=0.0), make_evidence(BERLIN, relevance=0.0)]
+
+        EvidenceService()._score_relevance("Paris capital of France", evidence)
+
+        for item in evidence:
+            assert 0.0 <= item.relevance_score <= 1.0
+            assert item.relevance_score == round(item.relevance_score, 3)
+
+    def test_ranks_matching_content_higher(self):
+        """Test that content matching the query outscores unrelated content."""
+        evidence = [make_evidence(BERLIN), make_evidence(PARIS)]
+
+        EvidenceService()._score_relevance("Paris is the capital of France", evidence)
+
+        assert evidence[1].relevance_score > evidence[0].relevance_score
+
+    def test_case_and_punctuation_ignored(self):
+        """Test that queries are compared after normalization."""
+        evidence = [make_evidence("The Eiffel Tower is in Paris.")]
+
+        EvidenceService()._score_relevance("eiffel tower, PARIS", evidence)
+
+        assert evidence[0].relevance_score == 1.0
+
+    def test_unrelated_content(self):
+        """Test that content sharing no words with the query scores low."""
+        evidence = [make_evidence("Photosynthesis converts light into chemical energy.")]
+
+        EvidenceService()._score_relevance("Paris capital", evidence)
+
+        assert evidence[0].relevance_score < 0.5
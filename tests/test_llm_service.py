@@ -0,0 +1,445 @@
+"""
+Tests for LLM service request throttling.
+
+Covers the shared provider session and its connection pre-warming,
+parsing of provider rate-limit headers, the pre-send quota check that lets
+call_llm_with_fallback skip a provider instead of collecting a 429, and the
+adaptive (AIMD) bound on concurrent provider calls.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from multidict import CIMultiDict
+
+from src.agents.agent_models import LLMRequest
+from src.config.llm_config import LLMProvider
+from src.services import llm_service as llm_service_module
+from src.services.llm_service import (
+    AIMDController, LLMService, LLMServiceError, LLMAPIError, LLMRateLimitError,
+    _parse_reset_seconds
+)
+
+
+def openai_headers(limit: str, remaining: str, reset: str) -> CIMultiDict:
+    """Build OpenAI-style rate-limit response headers."""
+    return CIMultiDict({
+        "x-ratelimit-limit-requests": limit,
+        "x-ratelimit-remaining-requests": remaining,
+        "x-ratelimit-reset-requests": reset,
+    })
+
+
+class FakeResponse:
+    """Provider response returning a canned OpenAI completion."""
+
+    status = 200
+    headers = CIMultiDict()
+
+    async def json(self):
+        return {
+            "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"total_tokens": 3}
+        }
+
+
+class FakeRequestContext:
+    """Async context manager yielding a FakeResponse."""
+
+    async def __aenter__(self):
+        return FakeResponse()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """Session stand-in recording the URLs requested."""
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, url, **kwargs):
+        self.posted.append(url)
+        return FakeRequestContext()
+
+    def head(self, url, **kwargs):
+        self.posted.append(url)
+        return FakeRequestContext()
+
+
+class TestSharedSession:
+    """Test that provider calls reuse the process-wide session."""
+
+    @pytest.mark.asyncio
+    async def test_call_without_context_manager_uses_shared_session(self, monkeypatch):
+        """Test that the module-level service works without async with."""
+        shared = FakeSession()
+        monkeypatch.setattr(llm_service_module, "get_shared_session", lambda: shared)
+        service = LLMService()
+
+        response = await service.call_openai(LLMRequest(prompt="claim", model="test", parameters={}))
+
+        assert response.content == "ok"
+        assert shared.posted == ["https://api.openai.com/v1/chat/completions"]
+
+    @pytest.mark.asyncio
+    async def test_context_manager_leaves_shared_session_open(self, monkeypatch):
+        """Test that exiting one context does not close the session for others."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        try:
+            async with LLMService() as first:
+                session = first.session
+            async with LLMService() as second:
+                assert second.session is session
+
+            assert not session.closed
+        finally:
+            await llm_service_module.close_shared_session()
+
+        assert session.closed
+
+    def test_session_from_earlier_event_loop_is_replaced(self, monkeypatch):
+        """Test that a service entered under one loop gets a fresh session under the next."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        service = LLMService()
+
+        async def entered():
+            async with service:
+                return service._get_session()
+
+        async def context_free():
+            try:
+                session = service._get_session()
+                assert session._loop is asyncio.get_running_loop()
+                return session
+            finally:
+                await llm_service_module.close_shared_session()
+
+        first = asyncio.run(entered())
+        second = asyncio.run(context_free())
+
+        assert second is not first
+        assert service.session is first
+
+
+class TestPrewarm:
+    """Test background pre-warming of provider connections."""
+
+    @pytest.mark.asyncio
+    async def test_only_configured_providers_are_warmed(self, monkeypatch):
+        """Test that providers without an API key are not contacted."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        session = FakeSession()
+
+        await llm_service_module._prewarm_connections(session)
+
+        assert session.posted == ["https://api.openai.com/v1"]
+
+    @pytest.mark.asyncio
+    async def test_shared_session_starts_and_close_cancels_prewarm(self, monkeypatch):
+        """Test that creating the session pre-warms without async with and shutdown cancels it."""
+        started = asyncio.Event()
+
+        async def slow_prewarm(session):
+            started.set()
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(llm_service_module, "_prewarm_connections", slow_prewarm)
+        try:
+            llm_service_module.get_shared_session()
+            task = llm_service_module._prewarm_task
+            await started.wait()
+        finally:
+            await llm_service_module.close_shared_session()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert llm_service_module._prewarm_task is None
+
+
+class TestParseResetSeconds:
+    """Test conversion of reset headers into seconds from now."""
+
+    def test_plain_seconds(self):
+        """Test retry-after style numeric values."""
+        assert _parse_reset_seconds("2.5") == 2.5
+        assert _parse_reset_seconds(" 30 ") == 30.0
+        assert _parse_reset_seconds("-1") == 0.0
+
+    def test_openai_durations(self):
+        """Test OpenAI duration strings with mixed units."""
+        assert _parse_reset_seconds("1s") == 1.0
+        assert _parse_reset_seconds("6m0s") == 360.0
+        assert _parse_reset_seconds("120ms") == pytest.approx(0.12)
+        assert _parse_reset_seconds("1h2m3s") == 3723.0
+
+    def test_rfc3339_timestamps(self):
+        """Test Anthropic RFC 3339 reset timestamps."""
+        future = (datetime.now(timezone.utc) + timedelta(seconds=60)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        assert 55 <= _parse_reset_seconds(future) <= 60
+        assert _parse_reset_seconds("2020-01-01T00:00:00Z") == 0.0
+
+    def test_unparseable_value(self):
+        """Test that unknown formats are ignored."""
+        assert _parse_reset_seconds("soon") is None
+
+
+class TestUpdateRateLimit:
+    """Test recording of provider quota from response headers."""
+
+    def test_openai_headers(self):
+        """Test that OpenAI limit, remaining and reset are recorded."""
+        service = LLMService()
+        before = time.monotonic()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "40", "55s"))
+
+        state = service._rate_limit_state[LLMProvider.OPENAI]
+        assert state["limit"] == 500.0
+        assert state["remaining"] == 40.0
+        assert state["reserved"] == 0.0
+        assert before + 55 <= state["reset_at"] <= time.monotonic() + 55
+
+    def test_anthropic_headers(self):
+        """Test that Anthropic headers are read case-insensitively."""
+        service = LLMService()
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        service._update_rate_limit(LLMProvider.ANTHROPIC, CIMultiDict({
+            "Anthropic-RateLimit-Requests-Limit": "50",
+            "Anthropic-RateLimit-Requests-Remaining": "49",
+            "Anthropic-RateLimit-Requests-Reset": reset,
+        }))
+
+        state = service._rate_limit_state[LLMProvider.ANTHROPIC]
+        assert state["limit"] == 50.0
+        assert state["remaining"] == 49.0
+        assert state["reset_at"] > time.monotonic() + 25
+
+    def test_retry_after_marks_quota_exhausted(self):
+        """Test that retry-after zeroes the quota until it elapses."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "10", "1s"))
+        service._update_rate_limit(LLMProvider.OPENAI, CIMultiDict({"retry-after": "20"}))
+
+        state = service._rate_limit_state[LLMProvider.OPENAI]
+        assert state["remaining"] == 0.0
+        assert state["reset_at"] > time.monotonic() + 15
+
+    def test_invalid_values_are_ignored(self):
+        """Test that malformed headers leave the state usable."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("lots", "some", "later"))
+
+        assert "remaining" not in service._rate_limit_state[LLMProvider.OPENAI]
+
+
+class TestWaitIfThrottled:
+    """Test the pre-send quota check."""
+
+    @pytest.mark.asyncio
+    async def test_no_state_admits(self):
+        """Test that calls pass before any quota has been reported."""
+        service = LLMService()
+        await service._wait_if_throttled(LLMProvider.OPENAI)
+
+    @pytest.mark.asyncio
+    async def test_low_quota_with_distant_reset_admits(self):
+        """Test that a low but non-zero quota does not block the provider."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "40", "55s"))
+
+        for _ in range(20):
+            await service._wait_if_throttled(LLMProvider.OPENAI)
+
+        assert service._rate_limit_state[LLMProvider.OPENAI]["reserved"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_fails_fast(self):
+        """Test that a used-up quota far from reset raises immediately."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "0", "55s"))
+
+        with pytest.raises(LLMRateLimitError):
+            await service._wait_if_throttled(LLMProvider.OPENAI)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_waits_for_near_reset(self):
+        """Test that a used-up quota resetting soon is waited out."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "0", "100ms"))
+
+        start = time.monotonic()
+        await service._wait_if_throttled(LLMProvider.OPENAI)
+
+        assert time.monotonic() - start >= 0.09
+        assert LLMProvider.OPENAI not in service._rate_limit_state
+
+    @pytest.mark.asyncio
+    async def test_low_quota_waits_for_near_reset(self):
+        """Test that a quota below the threshold pauses until an imminent reset."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "10", "100ms"))
+
+        start = time.monotonic()
+        await service._wait_if_throttled(LLMProvider.OPENAI)
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_elapsed_reset_clears_state(self):
+        """Test that state from a passed quota window is discarded."""
+        service = LLMService()
+        service._update_rate_limit(LLMProvider.OPENAI, openai_headers("500", "0", "0s"))
+
+        await service._wait_if_throttled(LLMProvider.OPENAI)
+
+        assert LLMProvider.OPENAI not in service._rate_limit_state
+
+
+class TestAIMDController:
+    """Test the adaptive concurrency limit."""
+
+    @pytest.mark.asyncio
+    async def test_slot_bounds_concurrency(self):
+        """Test that no more calls than the limit hold a slot at once."""
+        controller = AIMDController(initial_limit=3)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with controller.slot():
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(12)))
+
+        assert peak == 3
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_released_on_error(self):
+        """Test that a failing call gives its slot back."""
+        controller = AIMDController(initial_limit=1)
+
+        with pytest.raises(ValueError):
+            async with controller.slot():
+                raise ValueError("boom")
+
+        async with controller.slot():
+            assert controller.in_flight == 1
+
+    def test_additive_increase(self):
+        """Test that fast successes raise the limit by alpha."""
+        controller = AIMDController(initial_limit=4, alpha=0.5, target_latency_ms=1000)
+
+        controller.on_success(200)
+        controller.on_success(200)
+
+        assert controller.limit == 5.0
+
+    def test_slow_success_keeps_limit(self):
+        """Test that successes over the latency target do not raise the limit."""
+        controller = AIMDController(initial_limit=4, target_latency_ms=1000)
+
+        controller.on_success(5000)
+
+        assert controller.limit == 4.0
+
+    def test_multiplicative_decrease(self):
+        """Test that errors scale the limit by beta."""
+        controller = AIMDController(initial_limit=8, beta=0.5)
+
+        controller.on_error()
+
+        assert controller.limit == 4.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_errors_decrease_once(self):
+        """Test that a burst of failures among in-flight calls halves the limit only once."""
+        controller = AIMDController(initial_limit=8, beta=0.5)
+        release = asyncio.Event()
+
+        async def failing_call():
+            async with controller.slot() as ticket:
+                await release.wait()
+            controller.on_error(ticket)
+
+        tasks = [asyncio.create_task(failing_call()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert controller.limit == 4.0
+
+    @pytest.mark.asyncio
+    async def test_error_after_decrease_is_new_event(self):
+        """Test that a call admitted after a decrease can decrease the limit again."""
+        controller = AIMDController(initial_limit=8, beta=0.5)
+
+        async with controller.slot() as early:
+            pass
+        controller.on_error(early)
+        async with controller.slot() as late:
+            pass
+        controller.on_error(early)
+        assert controller.limit == 4.0
+
+        controller.on_error(late)
+        assert controller.limit == 2.0
+
+    def test_limit_clamped(self):
+        """Test that the limit stays within min_limit and max_limit."""
+        controller = AIMDController(initial_limit=2, min_limit=1, max_limit=3, alpha=1)
+
+        for _ in range(5):
+            controller.on_success(0)
+        assert controller.limit == 3
+
+        for _ in range(5):
+            controller.on_error()
+        assert controller.limit == 1
+
+
+class TestOverloadClassification:
+    """Test which provider failures shrink the concurrency limit."""
+
+    def test_indicates_overload(self):
+        """Test that only 429, 5xx and timeouts count as overload."""
+        assert LLMRateLimitError("limited", status=429).indicates_overload
+        assert LLMAPIError("server", status=503).indicates_overload
+        assert LLMAPIError("timeout", timeout=True).indicates_overload
+
+        assert not LLMAPIError("unauthorized", status=401).indicates_overload
+        assert not LLMAPIError("bad payload").indicates_overload
+        assert not LLMRateLimitError("local throttle").indicates_overload
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error, shrinks", [
+        (LLMAPIError("OpenAI API error: 401", status=401), False),
+        (LLMAPIError("OpenAI API error: malformed response"), False),
+        (LLMRateLimitError("openai request quota exhausted"), False),
+        (LLMAPIError("OpenAI API error: 500", status=500), True),
+        (LLMRateLimitError("OpenAI rate limit exceeded", status=429), True),
+        (LLMAPIError("OpenAI API timeout", timeout=True), True),
+    ])
+    async def test_fallback_shrinks_limit_only_on_overload(self, monkeypatch, error, shrinks):
+        """Test that call_llm_with_fallback decreases concurrency only for overload errors."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        service = LLMService()
+        initial_limit = service.concurrency.limit
+
+        async def failing_call(request):
+            raise error
+
+        service.call_openai = failing_call
+
+        with pytest.raises(LLMServiceError):
+            await service.call_llm_with_fallback(LLMRequest(prompt="claim", model="test", parameters={}))
+
+        assert (service.concurrency.limit < initial_limit) == shrinks